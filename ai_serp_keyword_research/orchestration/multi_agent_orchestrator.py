@@ -1,3 +1,43 @@
+import asyncio
+
+
+async def _wait_all(tasks):
+    """Wait for ``tasks``, cancelling the rest as soon as one fails.
+
+    Parameters
+    ----------
+    tasks: list of asyncio.Task
+        Tasks to wait for, in the order their failures should be reported.
+
+    Raises
+    ------
+    Exception
+        The exception of the first failed task in ``tasks``, unwrapped.
+    """
+    if not tasks:
+        return
+
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    if pending:
+        await asyncio.wait(pending)
+
+    failed = [
+        task
+        for task in tasks
+        if not task.cancelled() and task.exception() is not None
+    ]
+    # A task that failed before the others were cancelled takes precedence
+    # over one that failed while being cancelled.
+    failed.sort(key=lambda task: task not in done)
+    if failed:
+        raise failed[0].exception()
+
+
 class SerpKeywordAnalysisOrchestrator:
     """Orchestrates calls to individual SERP keyword analysis agents."""
 
@@ -18,16 +58,79 @@ class SerpKeywordAnalysisOrchestrator:
         self.market_gap_agent = market_gap_agent
 
     async def analyze(self, search_term, serp_data, intent_analysis, market_gap):
-        """Run each agent and return a dictionary with their results."""
-        results = {"search_term": search_term}
+        """Run each agent and return a dictionary with their results.
+
+        The agents do not depend on each other's output, so they run
+        concurrently. If one agent fails, the others are cancelled and its
+        exception is re-raised unchanged.
+        """
+        tasks = {}
 
         if self.serp_agent is not None:
-            results["serp"] = await self.serp_agent(search_term, serp_data)
+            tasks["serp"] = asyncio.create_task(
+                self.serp_agent(search_term, serp_data)
+            )
 
         if self.intent_agent is not None:
-            results["intent"] = await self.intent_agent(search_term, intent_analysis)
+            tasks["intent"] = asyncio.create_task(
+                self.intent_agent(search_term, intent_analysis)
+            )
 
         if self.market_gap_agent is not None:
-            results["market_gap"] = await self.market_gap_agent(search_term, market_gap)
+            tasks["market_gap"] = asyncio.create_task(
+                self.market_gap_agent(search_term, market_gap)
+            )
+
+        await _wait_all(list(tasks.values()))
 
+        results = {"search_term": search_term}
+        results.update((key, task.result()) for key, task in tasks.items())
         return results
+
+    async def analyze_many(self, requests, max_concurrency=None):
+        """Analyze several search terms, overlapping their agent calls.
+
+        If any term fails, the terms still running are cancelled and the
+        first failure is re-raised unchanged, as :meth:`analyze` does.
+
+        Parameters
+        ----------
+        requests: iterable of tuple
+            ``(search_term, serp_data, intent_analysis, market_gap)`` tuples,
+            one per search term, matching the arguments of :meth:`analyze`.
+        max_concurrency: int, optional
+            Maximum number of search terms analyzed at the same time. Must be
+            a positive integer. When given, that many workers pull terms from
+            ``requests`` one at a time, so the iterable is consumed lazily.
+            When omitted, ``requests`` is read up front and all terms run at
+            once.
+
+        Returns
+        -------
+        list of dict
+            The results of :meth:`analyze`, in the same order as ``requests``.
+
+        Raises
+        ------
+        ValueError
+            If ``max_concurrency`` is less than 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        requests = enumerate(requests)
+        if max_concurrency is None:
+            requests = list(requests)
+            max_concurrency = len(requests)
+            requests = iter(requests)
+
+        results = {}
+
+        async def worker():
+            for index, request in requests:
+                results[index] = await self.analyze(*request)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        await _wait_all(workers)
+
+        return [results[index] for index in range(len(results))]
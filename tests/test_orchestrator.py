@@ -0,0 +1,182 @@
+import asyncio
+import time
+import unittest
+
+from ai_serp_keyword_research.orchestration.multi_agent_orchestrator import (
+    SerpKeywordAnalysisOrchestrator,
+)
+
+
+def make_agent(delay=0.0, log=None):
+    """Return an async agent that sleeps for ``delay`` and echoes its data."""
+
+    async def agent(search_term, data):
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(search_term)
+        return data
+
+    return agent
+
+
+def make_failing_agent(exc):
+    """Return an async agent that raises ``exc`` for "bad" search terms."""
+
+    async def agent(search_term, data):
+        if search_term.startswith("bad"):
+            raise exc
+        return data
+
+    return agent
+
+
+def make_requests(count):
+    return [(f"term {i}", i, i, i) for i in range(count)]
+
+
+class TestAnalyze(unittest.TestCase):
+    def test_returns_results_keyed_by_agent(self):
+        orchestrator = SerpKeywordAnalysisOrchestrator(
+            serp_agent=make_agent(),
+            intent_agent=make_agent(),
+            market_gap_agent=make_agent(),
+        )
+
+        results = asyncio.run(orchestrator.analyze("dad tee", "serp", "intent", "gap"))
+
+        self.assertEqual(
+            results,
+            {
+                "search_term": "dad tee",
+                "serp": "serp",
+                "intent": "intent",
+                "market_gap": "gap",
+            },
+        )
+
+    def test_skips_missing_agents(self):
+        orchestrator = SerpKeywordAnalysisOrchestrator(intent_agent=make_agent())
+
+        results = asyncio.run(orchestrator.analyze("dad tee", "serp", "intent", "gap"))
+
+        self.assertEqual(results, {"search_term": "dad tee", "intent": "intent"})
+
+    def test_runs_agents_concurrently(self):
+        orchestrator = SerpKeywordAnalysisOrchestrator(
+            serp_agent=make_agent(0.1),
+            intent_agent=make_agent(0.1),
+            market_gap_agent=make_agent(0.1),
+        )
+
+        start = time.perf_counter()
+        asyncio.run(orchestrator.analyze("dad tee", "serp", "intent", "gap"))
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.25)
+
+    def test_failure_is_raised_unwrapped_and_cancels_other_agents(self):
+        finished = []
+        orchestrator = SerpKeywordAnalysisOrchestrator(
+            serp_agent=make_failing_agent(ValueError("boom")),
+            intent_agent=make_agent(0.1, finished),
+            market_gap_agent=make_agent(0.1, finished),
+        )
+
+        async def run():
+            with self.assertRaisesRegex(ValueError, "boom"):
+                await orchestrator.analyze("bad term", "serp", "intent", "gap")
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+
+        self.assertEqual(finished, [])
+
+
+class TestAnalyzeMany(unittest.TestCase):
+    def test_results_follow_input_order(self):
+        orchestrator = SerpKeywordAnalysisOrchestrator(serp_agent=make_agent(0.01))
+        requests = make_requests(8)
+
+        results = asyncio.run(orchestrator.analyze_many(requests, max_concurrency=3))
+
+        self.assertEqual(
+            [result["search_term"] for result in results],
+            [request[0] for request in requests],
+        )
+        self.assertEqual([result["serp"] for result in results], list(range(8)))
+
+    def test_pipeline_batch_throughput(self):
+        orchestrator = SerpKeywordAnalysisOrchestrator(
+            serp_agent=make_agent(0.1),
+            intent_agent=make_agent(0.1),
+            market_gap_agent=make_agent(0.1),
+        )
+
+        start = time.perf_counter()
+        results = asyncio.run(
+            orchestrator.analyze_many(make_requests(8), max_concurrency=2)
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 8)
+        # Four rounds of two terms, each round as slow as a single agent.
+        self.assertGreaterEqual(elapsed, 0.35)
+        self.assertLess(elapsed, 0.6)
+
+    def test_reads_requests_lazily(self):
+        pulled = []
+
+        def requests():
+            for request in make_requests(8):
+                pulled.append(request[0])
+                yield request
+
+        orchestrator = SerpKeywordAnalysisOrchestrator(serp_agent=make_agent(0.1))
+
+        async def run():
+            task = asyncio.create_task(
+                orchestrator.analyze_many(requests(), max_concurrency=2)
+            )
+            await asyncio.sleep(0.05)
+            in_flight = list(pulled)
+            await task
+            return in_flight
+
+        self.assertEqual(asyncio.run(run()), ["term 0", "term 1"])
+
+    def test_rejects_non_positive_max_concurrency(self):
+        orchestrator = SerpKeywordAnalysisOrchestrator(serp_agent=make_agent())
+
+        for value in (0, -1):
+            with self.subTest(max_concurrency=value):
+                with self.assertRaisesRegex(ValueError, "max_concurrency"):
+                    asyncio.run(
+                        orchestrator.analyze_many(
+                            make_requests(2), max_concurrency=value
+                        )
+                    )
+
+    def test_failure_is_raised_unwrapped_and_cancels_other_terms(self):
+        finished = []
+        orchestrator = SerpKeywordAnalysisOrchestrator(
+            serp_agent=make_failing_agent(ValueError("boom")),
+            intent_agent=make_agent(0.1, finished),
+        )
+        requests = [
+            ("good term", 1, 1, 1),
+            ("bad term", 2, 2, 2),
+            ("other term", 3, 3, 3),
+        ]
+
+        async def run():
+            with self.assertRaisesRegex(ValueError, "boom"):
+                await orchestrator.analyze_many(requests)
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+
+        self.assertEqual(finished, [])
+
+
+if __name__ == "__main__":
+    unittest.main()